@@ -4,6 +4,8 @@ Configuration for Live Interview Copilot Backend
 Manages environment variables and configuration settings.
 """
 
+import functools
+import mmap
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,6 +15,42 @@ env_path = Path(__file__).parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_resume(path: str) -> str:
+    """
+    Read resume file once per path and keep it in memory
+    
+    The text is also cached on disk in "<path>.cache", prefixed with the
+    resume's mtime (8 bytes, little-endian ns) so restarts skip re-reading
+    the source until it changes.
+    """
+    if not path or not os.path.exists(path):
+        return ""
+    
+    mtime_ns = os.stat(path).st_mtime_ns
+    header = mtime_ns.to_bytes(8, 'little')
+    cache_path = Path(path + '.cache')
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if m[:8] == header:
+                    return m[8:].decode()
+    except (OSError, ValueError):
+        # Missing, empty or unreadable cache - fall back to the source
+        pass
+    
+    with open(path, 'r') as f:
+        content = f.read()
+    
+    try:
+        cache_path.write_bytes(header + content.encode())
+    except OSError:
+        pass
+    
+    return content
+
+
 class Config:
     """Application configuration"""
     
@@ -30,6 +68,9 @@ class Config:
     # Audio settings
     AUDIO_SAMPLE_RATE = 16000  # 16kHz for Deepgram
     AUDIO_CHUNK_SIZE = 250  # 250ms chunks
+    AUDIO_BATCH_BYTES = 8192  # Coalesce small frames up to this size
+    AUDIO_BATCH_MS = 100  # ...or until this much time has passed
+    AUDIO_MAX_PENDING_SENDS = 4  # Concurrent in-flight sends to Deepgram
     
     # LLM settings
     LLM_MODEL = os.getenv('LLM_MODEL', 'llama3-70b-8192')
@@ -38,6 +79,8 @@ class Config:
     
     # Transcription settings
     SENTENCE_END_PAUSE_MS = 3000  # 3 seconds
+    MAX_BUFFER_CHARS = 2048  # Force-flush transcript buffer past this size
+    MAX_BUFFER_FRAGMENTS = 64
     
     @classmethod
     def validate(cls):
@@ -55,10 +98,7 @@ class Config:
     @classmethod
     def load_resume(cls) -> str:
         """Load resume from file if path is specified"""
-        if cls.RESUME_PATH and os.path.exists(cls.RESUME_PATH):
-            with open(cls.RESUME_PATH, 'r') as f:
-                return f.read()
-        return ""
+        return _read_resume(cls.RESUME_PATH)
 
 
 # Create a singleton instance
@@ -6,6 +6,8 @@ Optimized for real-time interview transcription.
 """
 
 import asyncio
+import collections
+import functools
 import json
 import logging
 from typing import AsyncIterator, Optional
@@ -19,6 +21,15 @@ from deepgram import (
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str) -> DeepgramClient:
+    """Return the Deepgram client shared by all sessions using this key"""
+    config = DeepgramClientOptions(
+        options={"keepalive": "true"}
+    )
+    return DeepgramClient(api_key, config)
+
+
 class DeepgramTranscriber:
     """
     Wrapper for Deepgram streaming transcription
@@ -29,6 +40,9 @@ class DeepgramTranscriber:
     - Smart formatting: Enabled (adds punctuation)
     - Interim results: Enabled (get partial transcripts)
     - Utterance end: 1000ms (detect when speaker finishes)
+    
+    Create one instance per session: it holds that session's transcript
+    buffer, while the underlying DeepgramClient is shared.
     """
     
     def __init__(self, api_key: str):
@@ -37,14 +51,16 @@ class DeepgramTranscriber:
         
         self.api_key = api_key
         
-        # Initialize Deepgram client
-        config = DeepgramClientOptions(
-            options={"keepalive": "true"}
-        )
-        self.client = DeepgramClient(api_key, config)
+        # Shared Deepgram client
+        self.client = _get_client(api_key)
+        
+        # Buffer for transcription results; the event wakes the consumer,
+        # which then drains everything buffered since the last wakeup
+        self._buf = collections.deque()
+        self._evt = asyncio.Event()
         
-        # Queue for transcription results
-        self.transcription_queue = asyncio.Queue()
+        # Fingerprint of the last forwarded transcript, to drop repeats
+        self._last_hash = 0
     
     async def start_transcription(self):
         """
@@ -83,19 +99,26 @@ class DeepgramTranscriber:
                     is_final = result.is_final
                     
                     if is_final:
-                        logger.info(f"Final transcript: {sentence}")
-                        await self.transcription_queue.put(sentence)
+                        # Skip transcripts identical to the last one forwarded
+                        h = hash(sentence)
+                        if h == self._last_hash:
+                            return
+                        self._last_hash = h
+                        
+                        logger.info("Final transcript: %s", sentence)
+                        self._buf.append(sentence)
+                        self._evt.set()
                     else:
-                        logger.debug(f"Interim transcript: {sentence}")
+                        logger.debug("Interim transcript: %s", sentence)
                         # Optionally handle interim results
-                        # await self.transcription_queue.put(f"[interim] {sentence}")
+                        # self._buf.append(f"[interim] {sentence}")
                 
                 except Exception as e:
-                    logger.error(f"Error processing transcription: {e}")
+                    logger.error("Error processing transcription: %s", e)
             
             async def on_error(self_inner, error, **kwargs):
                 """Handle errors"""
-                logger.error(f"Deepgram error: {error}")
+                logger.error("Deepgram error: %s", error)
             
             async def on_close(self_inner, close_event, **kwargs):
                 """Handle connection close"""
@@ -114,7 +137,7 @@ class DeepgramTranscriber:
                 raise Exception("Failed to start Deepgram connection")
         
         except Exception as e:
-            logger.error(f"Error starting Deepgram transcription: {e}")
+            logger.error("Error starting Deepgram transcription: %s", e)
             raise
     
     async def send_audio(self, connection, audio_data: bytes):
@@ -128,7 +151,7 @@ class DeepgramTranscriber:
         try:
             await connection.send(audio_data)
         except Exception as e:
-            logger.error(f"Error sending audio to Deepgram: {e}")
+            logger.error("Error sending audio to Deepgram: %s", e)
             raise
     
     async def get_transcriptions(self, connection) -> AsyncIterator[str]:
@@ -140,13 +163,15 @@ class DeepgramTranscriber:
         """
         try:
             while True:
-                # Get transcription from queue
-                transcription = await self.transcription_queue.get()
-                yield transcription
+                # Wait for new transcriptions, then drain the whole burst
+                await self._evt.wait()
+                self._evt.clear()
+                while self._buf:
+                    yield self._buf.popleft()
         except asyncio.CancelledError:
             logger.info("Transcription generator cancelled")
         except Exception as e:
-            logger.error(f"Error in transcription generator: {e}")
+            logger.error("Error in transcription generator: %s", e)
     
     async def close(self, connection):
         """Close the Deepgram connection"""
@@ -154,4 +179,4 @@ class DeepgramTranscriber:
             await connection.finish()
             logger.info("Deepgram connection closed")
         except Exception as e:
-            logger.error(f"Error closing Deepgram connection: {e}")
+            logger.error("Error closing Deepgram connection: %s", e)
@@ -5,9 +5,10 @@ Uses Groq's API with Llama 3 model for generating interview assistance.
 Optimized for low latency and concise responses.
 """
 
-import asyncio
 import logging
+import time
 from typing import Optional
+import httpx
 from groq import AsyncGroq
 
 logger = logging.getLogger(__name__)
@@ -30,7 +31,19 @@ class GroqLLMClient:
         
         self.api_key = api_key
         self.resume_text = resume_text
-        self.client = AsyncGroq(api_key=api_key)
+        
+        # Shared HTTP/2 connection pool so bursts of LLM calls reuse
+        # warm TLS connections instead of handshaking per request
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=60
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        self.client = AsyncGroq(api_key=api_key, http_client=self._http)
         
         # System prompt template
         self.system_prompt = f"""You are an interview assistant helping a candidate respond effectively during a live interview.
@@ -51,6 +64,20 @@ Guidelines:
 - Focus on key points from the resume
 - Suggest specific examples when helpful
 - Don't be overly formal"""
+        
+        # Prebuilt message pieces reused on every request
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+        self._user_tmpl = "Interview question/discussion: {q}\n\nProvide a brief, helpful response suggestion:"
+    
+    def _build_messages(self, question: str) -> list:
+        """Build the chat messages list around the cached system message"""
+        return [
+            self._system_msg,
+            {
+                "role": "user",
+                "content": self._user_tmpl.format_map({"q": question})
+            }
+        ]
     
     async def get_response(self, question: str) -> str:
         """
@@ -63,21 +90,12 @@ Guidelines:
             AI-generated response suggestion
         """
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             # Create chat completion
             response = await self.client.chat.completions.create(
                 model="llama3-70b-8192",  # Fast and high-quality
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self.system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Interview question/discussion: {question}\n\nProvide a brief, helpful response suggestion:"
-                    }
-                ],
+                messages=self._build_messages(question),
                 temperature=0.7,  # Balanced creativity
                 max_tokens=150,  # Keep responses short
                 top_p=0.9,
@@ -88,21 +106,21 @@ Guidelines:
             assistant_message = response.choices[0].message.content.strip()
             
             # Calculate latency
-            end_time = asyncio.get_event_loop().time()
+            end_time = time.perf_counter()
             latency = end_time - start_time
             
-            logger.info(f"LLM response generated in {latency:.2f}s")
-            logger.debug(f"Token usage: {response.usage}")
+            logger.info("LLM response generated in %.2fs", latency)
+            logger.debug("Token usage: %s", response.usage)
             
             return assistant_message
         
         except Exception as e:
-            logger.error(f"Error getting LLM response: {e}")
+            logger.error("Error getting LLM response: %s", e)
             raise
     
     async def get_streaming_response(self, question: str):
         """
-        Get streaming LLM response (for future optimization)
+        Get streaming LLM response
         
         Args:
             question: Transcribed interview question
@@ -111,27 +129,37 @@ Guidelines:
             Response chunks as they're generated
         """
         try:
+            start_time = time.perf_counter()
+            
             stream = await self.client.chat.completions.create(
                 model="llama3-70b-8192",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self.system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Interview question: {question}\n\nProvide a brief response:"
-                    }
-                ],
+                messages=self._build_messages(question),
                 temperature=0.7,
                 max_tokens=150,
-                stream=True
+                top_p=0.9,
+                stream=True,
+                # Ask for a trailing usage chunk so token counts are still logged
+                extra_body={"stream_options": {"include_usage": True}}
             )
             
             async for chunk in stream:
-                if chunk.choices[0].delta.content:
+                if chunk.choices and chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
+                
+                usage = getattr(chunk, "usage", None)
+                if usage:
+                    logger.debug("Token usage: %s", usage)
+            
+            # Calculate latency
+            end_time = time.perf_counter()
+            latency = end_time - start_time
+            
+            logger.info("LLM response streamed in %.2fs", latency)
         
         except Exception as e:
-            logger.error(f"Error in streaming response: {e}")
+            logger.error("Error in streaming response: %s", e)
             raise
+    
+    async def aclose(self):
+        """Close the underlying HTTP connection pool"""
+        await self._http.aclose()
@@ -16,17 +16,27 @@ Architecture:
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
-import json
-import os
-from typing import Optional, List
+import atexit
+import io
+import queue
+from typing import Optional, Set
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import sys
+import time
 
 # Configure logging
+# Records are queued and written to stderr by a background thread so the
+# event loop never blocks on console I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Auto-setup: Check if backend setup is complete and run setup if needed
@@ -45,37 +55,45 @@ try:
     else:
         logger.info("Backend setup verified. Proceeding with server startup...")
 except Exception as e:
-    logger.warning(f"Setup check failed: {e}. Continuing with startup...")
+    logger.warning("Setup check failed: %s. Continuing with startup...", e)
     # Continue even if setup check fails - let the normal startup handle missing dependencies
 
-# Import our custom clients
+# Import configuration and our custom clients
+import msgspec
+from config import config
 from deepgram_client import DeepgramTranscriber
 from groq_client import GroqLLMClient
+from messages import (
+    ErrorMsg,
+    LLMResponseDeltaMsg,
+    LLMResponseEndMsg,
+    TranscriptMsg,
+    encoder,
+    metadata_decoder,
+)
 
 # Initialize FastAPI app
 app = FastAPI(title="Live Interview Copilot Backend")
 
 # CORS Configuration
 # CRITICAL: Must allow chrome-extension:// scheme for extension communication
+# Starlette matches allow_origins literally, so a "chrome-extension://*" entry
+# never matched; a regex covers any extension ID (32 chars a-p) plus the
+# development (3000) and self (8000) localhost origins.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "chrome-extension://*",  # Allow any chrome extension
-        "http://localhost:3000",  # Development
-        "http://localhost:8000",  # Self
-    ],
+    allow_origin_regex=r"^(chrome-extension://[a-p]{32}|http://localhost:(?:3000|8000))$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Configuration from environment variables
-DEEPGRAM_API_KEY = os.getenv('DEEPGRAM_API_KEY', '')
-GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
+# Configuration loaded once from .env / environment
+DEEPGRAM_API_KEY = config.DEEPGRAM_API_KEY
+GROQ_API_KEY = config.GROQ_API_KEY
 
-# Placeholder for resume context
-# TODO: Replace with actual resume text or load from file
-RESUME_TEXT = """
+# Placeholder resume context, used when RESUME_PATH is not set
+DEFAULT_RESUME = """
 John Doe - Senior Software Engineer
 - 5 years of experience in full-stack development
 - Expert in Python, JavaScript, React, and FastAPI
@@ -85,8 +103,22 @@ John Doe - Senior Software Engineer
 - Led team of 4 engineers on critical projects
 """
 
+RESUME_TEXT = config.load_resume() or DEFAULT_RESUME
+
+# Punctuation that marks the end of a spoken sentence
+_PUNCT_SET = frozenset((".", "?", "!"))
+
+
+def _ends_with_punctuation(text: str) -> bool:
+    """Check the last non-whitespace character without copying the string"""
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return i >= 0 and text[i] in _PUNCT_SET
+
+
 # Initialize clients
-deepgram_transcriber = DeepgramTranscriber(DEEPGRAM_API_KEY)
+# Deepgram transcribers are created per session so transcripts never mix
 groq_client = GroqLLMClient(GROQ_API_KEY, RESUME_TEXT)
 
 
@@ -94,29 +126,36 @@ class ConnectionManager:
     """Manage WebSocket connections"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        logger.info("Client connected. Total connections: %s", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)
+        logger.info("Client disconnected. Total connections: %s", len(self.active_connections))
     
-    async def send_message(self, websocket: WebSocket, message: dict):
+    async def send_message(self, websocket: WebSocket, message: msgspec.Struct):
         """Send JSON message to specific client"""
         try:
-            await websocket.send_text(json.dumps(message))
+            # msgspec encodes straight to UTF-8 bytes; the extension parses
+            # text frames with JSON.parse, so decode back to a text frame
+            await websocket.send_text(encoder.encode(message).decode())
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
 
 
 manager = ConnectionManager()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled connections on server shutdown"""
+    await groq_client.aclose()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -139,113 +178,207 @@ async def websocket_audio_endpoint(websocket: WebSocket):
     3. Stream audio to Deepgram for transcription
     4. Accumulate transcript until sentence completion
     5. Send complete sentences to Groq LLM
-    6. Stream responses back to extension
+    6. Stream response deltas back to extension as they are generated
     """
     await manager.connect(websocket)
     
     # Buffer for accumulating transcript
-    transcript_buffer = []
-    last_transcript_time = asyncio.get_event_loop().time()
+    transcript_buffer = io.StringIO()
+    buffered_fragments = 0
+    buffered_chars = 0
+    last_transcript_time = time.monotonic()
     
     try:
         # Start Deepgram transcription session
+        deepgram_transcriber = DeepgramTranscriber(DEEPGRAM_API_KEY)
         deepgram_connection = await deepgram_transcriber.start_transcription()
         
         # Create task to handle Deepgram responses
         async def handle_deepgram_responses():
             """Listen for transcription results from Deepgram"""
-            nonlocal transcript_buffer, last_transcript_time
+            nonlocal transcript_buffer, buffered_fragments, buffered_chars, last_transcript_time
             
             async for transcription in deepgram_transcriber.get_transcriptions(deepgram_connection):
                 if not transcription or not transcription.strip():
                     continue
                 
-                logger.info(f"Transcription: {transcription}")
+                logger.info("Transcription: %s", transcription)
                 
                 # Send transcript to client immediately
-                await manager.send_message(websocket, {
-                    "type": "transcript",
-                    "text": transcription
-                })
+                await manager.send_message(websocket, TranscriptMsg(text=transcription))
                 
                 # Add to buffer
-                transcript_buffer.append(transcription)
-                current_time = asyncio.get_event_loop().time()
+                if buffered_fragments:
+                    transcript_buffer.write(" ")
+                transcript_buffer.write(transcription)
+                buffered_fragments += 1
+                buffered_chars += len(transcription) + 1
+                current_time = time.monotonic()
                 
                 # Check for sentence completion
                 # Conditions: ends with punctuation OR 3+ seconds pause
+                # OR buffer reached its cap (bounds memory and time-to-LLM)
                 is_sentence_end = (
-                    transcription.rstrip().endswith(('.', '?', '!')) or
-                    (current_time - last_transcript_time) > 3.0
+                    _ends_with_punctuation(transcription) or
+                    (current_time - last_transcript_time) > 3.0 or
+                    buffered_chars > config.MAX_BUFFER_CHARS or
+                    buffered_fragments > config.MAX_BUFFER_FRAGMENTS
                 )
                 
                 last_transcript_time = current_time
                 
-                if is_sentence_end and transcript_buffer:
-                    # Join buffered transcripts into complete question
-                    complete_text = ' '.join(transcript_buffer).strip()
-                    transcript_buffer = []
+                if is_sentence_end and buffered_fragments:
+                    # Take buffered transcripts as the complete question
+                    complete_text = transcript_buffer.getvalue().strip()
+                    transcript_buffer = io.StringIO()
+                    buffered_fragments = 0
+                    buffered_chars = 0
                     
-                    logger.info(f"Complete sentence detected: {complete_text}")
+                    logger.info("Complete sentence detected: %s", complete_text)
                     
-                    # Send to LLM for response
+                    # Stream LLM response to client as it is generated
                     try:
-                        llm_response = await groq_client.get_response(complete_text)
-                        
-                        logger.info(f"LLM Response: {llm_response}")
+                        response_parts = []
+                        async for chunk in groq_client.get_streaming_response(complete_text):
+                            response_parts.append(chunk)
+                            await manager.send_message(websocket, LLMResponseDeltaMsg(
+                                text=chunk,
+                                question=complete_text
+                            ))
                         
-                        # Send LLM response to client
-                        await manager.send_message(websocket, {
-                            "type": "llm_response",
-                            "text": llm_response,
-                            "question": complete_text
-                        })
+                        logger.info("LLM Response: %s", ''.join(response_parts))
                     except Exception as e:
-                        logger.error(f"Error getting LLM response: {e}")
-                        await manager.send_message(websocket, {
-                            "type": "error",
-                            "message": f"LLM error: {str(e)}"
-                        })
+                        logger.error("Error getting LLM response: %s", e)
+                        await manager.send_message(websocket, ErrorMsg(
+                            message=f"LLM error: {str(e)}"
+                        ))
+                    finally:
+                        # Always close the stream so the client stops appending
+                        # to this answer, even if it failed partway through
+                        await manager.send_message(websocket, LLMResponseEndMsg())
+        
+        # Buffer for coalescing small audio frames before forwarding
+        audio_buffer = bytearray()
+        audio_buffered = asyncio.Event()
+        # When the oldest buffered byte arrived, and when audio was last sent
+        audio_buffered_at = 0.0
+        last_audio_flush = 0.0
+        audio_flush_interval = config.AUDIO_BATCH_MS / 1000
+        
+        # Deepgram sends run in the background so receiving from the client
+        # never waits on Deepgram's socket; the semaphore bounds how many
+        # sends may be outstanding and applies backpressure beyond that
+        audio_send_slots = asyncio.Semaphore(config.AUDIO_MAX_PENDING_SENDS)
+        pending_sends = set()
+        # First failed Deepgram send; the receive loop ends the session on it
+        audio_send_error = None
+        
+        async def send_audio_chunk(audio_chunk: bytes):
+            """Send one audio chunk to Deepgram and free its slot"""
+            nonlocal audio_send_error
+            try:
+                await deepgram_transcriber.send_audio(deepgram_connection, audio_chunk)
+            except Exception as e:
+                # Already logged by send_audio
+                if audio_send_error is None:
+                    audio_send_error = e
+            finally:
+                audio_send_slots.release()
         
-        # Start Deepgram response handler
+        async def flush_audio():
+            """Forward buffered audio to Deepgram as a single send"""
+            nonlocal last_audio_flush
+            if not audio_buffer:
+                return
+            
+            # Take the buffer only once a slot is held, so a flush cancelled
+            # while waiting for one leaves its audio buffered
+            await audio_send_slots.acquire()
+            if not audio_buffer:
+                # Flushed by the other caller while this one waited
+                audio_send_slots.release()
+                return
+            audio_chunk = bytes(audio_buffer)
+            audio_buffer.clear()
+            audio_buffered.clear()
+            last_audio_flush = time.monotonic()
+            task = asyncio.create_task(send_audio_chunk(audio_chunk))
+            pending_sends.add(task)
+            task.add_done_callback(pending_sends.discard)
+        
+        async def flush_audio_periodically():
+            """Flush buffered audio once its oldest byte is one interval old"""
+            while True:
+                await audio_buffered.wait()
+                delay = audio_buffered_at + audio_flush_interval - time.monotonic()
+                if delay > 0:
+                    # The buffer may be flushed and refilled meanwhile, so
+                    # recheck its age after waking
+                    await asyncio.sleep(delay)
+                    continue
+                await flush_audio()
+        
+        # Start Deepgram response handler and audio flush timer
         deepgram_task = asyncio.create_task(handle_deepgram_responses())
+        flush_task = asyncio.create_task(flush_audio_periodically())
         
         # Main loop: receive audio from client and forward to Deepgram
         while True:
             try:
+                if audio_send_error is not None:
+                    await manager.send_message(websocket, ErrorMsg(
+                        message=f"Deepgram error: {audio_send_error}"
+                    ))
+                    break
+                
                 # Receive message from client
                 data = await websocket.receive()
                 
-                if "text" in data:
-                    # JSON message (metadata)
-                    message = json.loads(data["text"])
-                    logger.debug(f"Received metadata: {message}")
-                    
-                elif "bytes" in data:
-                    # Binary audio data
-                    audio_chunk = data["bytes"]
+                # Binary audio is the common case, so check it first
+                audio_chunk = data.get("bytes")
+                if audio_chunk is not None:
+                    # Binary audio data, batched before forwarding to Deepgram
+                    if not audio_buffer:
+                        audio_buffered_at = time.monotonic()
+                        audio_buffered.set()
+                    audio_buffer.extend(audio_chunk)
                     
-                    # Forward to Deepgram
-                    await deepgram_transcriber.send_audio(deepgram_connection, audio_chunk)
+                    if (len(audio_buffer) >= config.AUDIO_BATCH_BYTES or
+                            time.monotonic() - last_audio_flush > audio_flush_interval):
+                        await flush_audio()
+                
+                elif "text" in data:
+                    # JSON message (metadata)
+                    try:
+                        message = metadata_decoder.decode(data["text"])
+                        logger.debug("Received metadata: %s", message)
+                    except msgspec.DecodeError as e:
+                        logger.warning("Ignoring invalid metadata: %s", e)
+                
+                elif data["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(data.get("code", 1000))
                     
             except WebSocketDisconnect:
                 logger.info("Client disconnected normally")
                 break
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error("Error in main loop: %s", e)
                 break
         
-        # Cleanup
+        # Cleanup: forward any audio still buffered before stopping the timer,
+        # unless Deepgram already stopped accepting it
+        if audio_send_error is None:
+            await flush_audio()
+        flush_task.cancel()
         deepgram_task.cancel()
+        if pending_sends:
+            await asyncio.gather(*pending_sends, return_exceptions=True)
         await deepgram_transcriber.close(deepgram_connection)
         
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         try:
-            await manager.send_message(websocket, {
-                "type": "error",
-                "message": str(e)
-            })
+            await manager.send_message(websocket, ErrorMsg(message=str(e)))
         except:
             pass
     finally:
@@ -262,12 +395,22 @@ if __name__ == "__main__":
         logger.warning("GROQ_API_KEY not set! LLM responses will not work.")
     
     logger.info("Starting Live Interview Copilot Backend...")
-    logger.info(f"Deepgram configured: {bool(DEEPGRAM_API_KEY)}")
-    logger.info(f"Groq configured: {bool(GROQ_API_KEY)}")
+    logger.info("Deepgram configured: %s", bool(DEEPGRAM_API_KEY))
+    logger.info("Groq configured: %s", bool(GROQ_API_KEY))
+    
+    # uvloop (libuv-based event loop) is not available on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
     
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        log_level="info",
+        loop=loop_impl,
+        http="httptools",
+        ws="websockets"
     )
@@ -0,0 +1,46 @@
+"""
+WebSocket Message Schemas for Live Interview Copilot
+
+Typed envelopes for messages exchanged with the Chrome extension.
+Encoded and decoded directly by msgspec without intermediate dicts.
+"""
+
+from typing import Union
+
+import msgspec
+
+
+class TranscriptMsg(msgspec.Struct, tag="transcript", tag_field="type"):
+    """Transcribed speech forwarded as soon as Deepgram finalizes it"""
+    text: str
+
+
+class LLMResponseDeltaMsg(msgspec.Struct, tag="llm_response_delta", tag_field="type"):
+    """Chunk of a streamed LLM response"""
+    text: str
+    question: str
+
+
+class LLMResponseEndMsg(msgspec.Struct, tag="llm_response_end", tag_field="type"):
+    """Marks the end of a streamed LLM response"""
+
+
+class ErrorMsg(msgspec.Struct, tag="error", tag_field="type"):
+    """Error reported to the client"""
+    message: str
+
+
+class AudioMetadata(msgspec.Struct, tag="audio", tag_field="type"):
+    """Metadata the extension sends ahead of each audio chunk"""
+    timestamp: int
+
+
+# Metadata frames the extension may send, dispatched on "type"
+Metadata = Union[AudioMetadata]
+
+
+# Shared encoder, reused for every outbound message
+encoder = msgspec.json.Encoder()
+
+# Shared decoder, reused for every inbound metadata frame
+metadata_decoder = msgspec.json.Decoder(Metadata)
@@ -5,33 +5,200 @@ Handles automatic setup of the Live Interview Copilot backend,
 including dependency installation, environment configuration, and validation.
 """
 
+from __future__ import annotations
+
+import hashlib
 import os
+import struct
 import sys
-import subprocess
-import shutil
+from functools import cached_property
 from pathlib import Path
-from typing import Tuple, List
+from typing import TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    from typing import NoReturn
+
+__all__ = ["BackendSetup", "perform_backend_setup", "is_setup_done", "main"]
+
 logger = logging.getLogger(__name__)
 
+# Backend directory and the files setup manages inside it
+_BACKEND_DIR = Path(__file__).resolve().parent
+_SETUP_FLAG_NAME = '.setup_complete'
+_PLAN_NAME = '.setup_complete_plan.json'
+_REPORT_NAME = '.setup_complete_report.json'
+_ENV_NAME = '.env'
+_ENV_EXAMPLE_NAME = '.env.example'
+_REQUIREMENTS_NAME = 'requirements.txt'
+_VENV_NAME = 'venv'
+
+_BANNER = "=" * 60
+
+# Fallback .env written when .env.example is missing
+_DEFAULT_ENV_BYTES = b"""# Deepgram API Key
+# Get your API key from: https://console.deepgram.com/
+DEEPGRAM_API_KEY=your_deepgram_api_key_here
+
+# Groq API Key
+# Get your API key from: https://console.groq.com/
+GROQ_API_KEY=your_groq_api_key_here
+
+# Optional: Server Configuration
+# HOST=0.0.0.0
+# PORT=8000
+
+# Optional: LLM Configuration
+# LLM_MODEL=llama3-70b-8192
+# LLM_TEMPERATURE=0.7
+# LLM_MAX_TOKENS=150
+"""
+
+# .setup_complete layout: format version + blake2b requirements digest
+_FLAG_FORMAT = struct.Struct("<I16s")
+_FLAG_VERSION = 1
+
+# Required API keys and the placeholder values shipped in .env.example
+_REQUIRED_KEYS: dict[str, str] = {
+    "DEEPGRAM_API_KEY": "your_deepgram_api_key_here",
+    "GROQ_API_KEY": "your_groq_api_key_here",
+}
+
+# requirements.txt options that pull in requirements from elsewhere
+_NESTED_REQUIREMENT_OPTIONS = frozenset((
+    "-r", "--requirement", "-c", "--constraint", "-e", "--editable",
+))
+
+# Top-level packages the server needs at runtime
+_REQUIRED_MODULES = ("fastapi", "uvicorn", "deepgram", "groq")
+
+
+def _spawn(args: list[str], **kwargs):
+    """
+    Run a command with subprocess.run on CPython's posix_spawn fast path
+    
+    subprocess only uses posix_spawn instead of fork/exec when the executable
+    path contains a directory (sys.executable is absolute), close_fds is
+    False, and no preexec_fn, pass_fds, cwd, start_new_session,
+    process_group, user/group or umask is given. Keep callers within those
+    limits. close_fds=False leaks nothing since Python creates file
+    descriptors non-inheritable (PEP 446).
+    """
+    import subprocess
+    
+    return subprocess.run(args, close_fds=False, **kwargs)
+
+
+def _parse_env_file(path: Path) -> dict[str, str] | None:
+    """
+    Parse a simple KEY=VALUE .env file without importing python-dotenv
+    
+    Blank lines and comments are skipped, a leading ``export`` is ignored,
+    surrounding quotes are removed and unquoted values end at an inline
+    `` #`` comment. The process environment is left untouched.
+    
+    Returns:
+        Mapping of keys to values, or None if the file cannot be read
+    """
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return None
+    
+    env = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, raw = line.split('=', 1)
+        key = key.strip()
+        if key.startswith('export '):
+            key = key[len('export '):].strip()
+        value = raw.strip()
+        end = value.find(value[0], 1) if value[:1] in ('"', "'") else -1
+        if end != -1:
+            # Quoted: everything up to the closing quote, '#' included
+            value = value[1:end]
+        else:
+            for marker in (' #', '\t#'):
+                raw = raw.split(marker, 1)[0]
+            value = raw.strip()
+        env[key] = value
+    return env
+
+
+def _site_packages_names() -> set[str]:
+    """List top-level package/distribution names in site-packages"""
+    import sysconfig
+    
+    names = set()
+    paths = sysconfig.get_paths()
+    for site_dir in {paths["purelib"], paths["platlib"]}:
+        try:
+            with os.scandir(site_dir) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext in (".dist-info", ""):
+                        names.add(name.split("-")[0].lower())
+        except OSError:
+            continue
+    return names
+
 
 class BackendSetup:
     """Manages automated backend setup and configuration"""
     
-    def __init__(self, backend_dir: Path = None):
+    # Backend directories already verified as set up in this process
+    _setup_complete_cache: dict[Path, bool] = {}
+    
+    def __init__(self, backend_dir: Path | None = None):
         """
         Initialize setup manager
         
         Args:
             backend_dir: Path to backend directory (defaults to current file's directory)
         """
-        self.backend_dir = backend_dir or Path(__file__).parent
-        self.setup_flag_file = self.backend_dir / '.setup_complete'
-        self.env_file = self.backend_dir / '.env'
-        self.env_example = self.backend_dir / '.env.example'
-        self.requirements_file = self.backend_dir / 'requirements.txt'
-        self.venv_dir = self.backend_dir / 'venv'
+        self.backend_dir = backend_dir or _BACKEND_DIR
+    
+    # Paths are built on first access, so the common is_setup_done() path
+    # only constructs the few it actually needs
+    
+    @cached_property
+    def setup_flag_file(self) -> Path:
+        return self.backend_dir / _SETUP_FLAG_NAME
+    
+    @cached_property
+    def plan_file(self) -> Path:
+        return self.backend_dir / _PLAN_NAME
+    
+    @cached_property
+    def report_file(self) -> Path:
+        return self.backend_dir / _REPORT_NAME
+    
+    @cached_property
+    def env_file(self) -> Path:
+        return self.backend_dir / _ENV_NAME
+    
+    @cached_property
+    def env_example(self) -> Path:
+        return self.backend_dir / _ENV_EXAMPLE_NAME
+    
+    @cached_property
+    def requirements_file(self) -> Path:
+        return self.backend_dir / _REQUIREMENTS_NAME
+    
+    @cached_property
+    def venv_dir(self) -> Path:
+        return self.backend_dir / _VENV_NAME
+    
+    @cached_property
+    def _env(self) -> dict[str, str] | None:
+        """Parsed .env contents, read once and shared by all checks"""
+        return _parse_env_file(self.env_file)
+    
+    def _invalidate_env(self):
+        """Drop the cached .env contents after the file is written"""
+        self.__dict__.pop('_env', None)
     
     def is_setup_complete(self) -> bool:
         """
@@ -40,27 +207,66 @@ class BackendSetup:
         Returns:
             True if setup is complete, False otherwise
         """
-        # Check for setup completion flag
-        if not self.setup_flag_file.exists():
+        if BackendSetup._setup_complete_cache.get(self.backend_dir):
+            return True
+        
+        # Check for setup completion flag, recorded for these requirements
+        recorded = self._recorded_digest()
+        if recorded is None:
             logger.info("Setup flag file not found")
             return False
         
+        try:
+            current = self._requirements_digest()
+        except OSError:
+            current = None
+        if recorded != current:
+            logger.info("Requirements changed since last setup")
+            return False
+        
         # Check if .env file exists
-        if not self.env_file.exists():
+        if self._env is None:
             logger.info(".env file not found")
             return False
         
         # Check if requirements are met (basic check)
+        # One directory listing of site-packages answers the common case;
+        # find_spec (which never executes module code) covers the rest,
+        # e.g. packages installed elsewhere on sys.path
+        installed = _site_packages_names()
+        missing = [m for m in _REQUIRED_MODULES if m not in installed]
+        if missing:
+            import importlib.util
+            missing = [m for m in missing if importlib.util.find_spec(m) is None]
+        
+        if missing:
+            logger.info("Missing required package: %s", ', '.join(missing))
+            return False
+        
+        logger.info("All required packages appear to be installed")
+        BackendSetup._setup_complete_cache[self.backend_dir] = True
+        return True
+    
+    @classmethod
+    def fast_health(cls) -> bool:
+        """
+        Cheap health probe for supervisors: never imports, reads or runs pip
+        
+        Only stats the setup flag, .env and requirements.txt. Editing .env
+        (e.g. adding API keys) is expected after setup and does not count;
+        a requirements.txt newer than the flag means setup is stale.
+        
+        Returns:
+            True if setup is complete, .env exists and requirements.txt
+            has not changed since setup
+        """
         try:
-            import fastapi
-            import uvicorn
-            import deepgram
-            import groq
-            logger.info("All required packages appear to be installed")
-            return True
-        except ImportError as e:
-            logger.info(f"Missing required package: {e}")
+            flag_mtime = (_BACKEND_DIR / _SETUP_FLAG_NAME).stat().st_mtime
+            (_BACKEND_DIR / _ENV_NAME).stat()
+            requirements_mtime = (_BACKEND_DIR / _REQUIREMENTS_NAME).stat().st_mtime
+        except FileNotFoundError:
             return False
+        return flag_mtime >= requirements_mtime
     
     def check_python_version(self) -> bool:
         """
@@ -88,18 +294,312 @@ class BackendSetup:
             logger.error(f"Requirements file not found: {self.requirements_file}")
             return False
         
-        try:
-            logger.info("Installing dependencies from requirements.txt...")
-            # Use pip to install requirements
-            subprocess.check_call([
-                sys.executable, '-m', 'pip', 'install', '-q',
-                '-r', str(self.requirements_file)
-            ])
+        # Turn the report left by a command-line install (_exec_install)
+        # into the install plan for later runs
+        if self.report_file.exists():
+            self._cache_plan(self.report_file)
+            self.report_file.unlink(missing_ok=True)
+        
+        # Skip pip entirely if every requirement is already installed
+        satisfied = self._requirements_satisfied()
+        if satisfied:
+            logger.info("All requirements already satisfied, skipping pip")
+            return True
+        
+        # ...or, when that cannot be verified, if these exact requirements
+        # were already installed
+        if satisfied is None and self._requirements_digest() == self._recorded_digest():
+            logger.info("Requirements unchanged since last install, skipping pip")
+            return True
+        
+        logger.info("Installing dependencies from requirements.txt...")
+        
+        # Install the exact versions a previous run resolved, bypassing pip's
+        # resolver. A plan only lists what that run had to install, so check
+        # the result before trusting it
+        pins = self._load_cached_plan()
+        if (pins
+                and self._run_pip(['--prefer-binary', '--no-deps', *pins],
+                                  error_level=logging.INFO)
+                and self._requirements_satisfied() is not False):
+            logger.info("Dependencies installed successfully")
+            return True
+        
+        # Single batched pip invocation for the whole requirements file, whose
+        # report becomes the install plan for the next run
+        if self._install_and_cache_plan():
             logger.info("Dependencies installed successfully")
             return True
+        
+        return False
+    
+    def _install(self, args: list[str]) -> bool:
+        """
+        Install from wheels only, falling back to allowing source builds
+        
+        Every runtime dependency ships wheels for the supported platforms, and
+        refusing sdists avoids spawning a build backend per package.
+        
+        Returns:
+            True if either attempt succeeded
+        """
+        if self._run_pip(['--only-binary=:all:', *args], error_level=logging.INFO):
+            return True
+        
+        logger.info("Wheel-only install failed, retrying with source builds allowed")
+        return self._run_pip(['--prefer-binary', *args])
+    
+    def _run_pip(self, args: list[str], error_level: int = logging.ERROR) -> bool:
+        """
+        Run ``pip install`` with the given arguments
+        
+        Args:
+            args: Extra arguments appended to ``pip install``
+            error_level: Logging level for a failed run
+        
+        Returns:
+            True if pip exited successfully
+        """
+        # Imported here so the setup-complete check never pays for it
+        import subprocess
+        
+        try:
+            _spawn([
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input', '-q',
+                *args
+            ], check=True)
+            return True
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install dependencies: {e}")
+            logger.log(error_level, "Failed to install dependencies: %s", e)
+            return False
+    
+    def _exec_install(self) -> NoReturn:
+        """
+        Replace the current process with ``pip install -r requirements.txt``
+        
+        Only for command-line use where installing is the final action:
+        unlike a subprocess there is no fork and no idle parent process.
+        Library callers should use install_dependencies().
+        
+        pip's report is left in report_file, which the next
+        install_dependencies() call turns into the cached install plan.
+        """
+        args = ['-r', str(self.requirements_file)]
+        if self._pip_supports_report():
+            args = ['--report', str(self.report_file), *args]
+        
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(sys.executable, [
+            sys.executable, '-m', 'pip', 'install',
+            '--disable-pip-version-check', '--no-input', '-q',
+            '--prefer-binary',
+            *args
+        ])
+    
+    def _plan_key(self) -> str:
+        """
+        Hash requirements.txt together with the interpreter version and
+        platform, which is everything a resolved install plan depends on
+        """
+        import sysconfig
+        
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{sys.implementation.cache_tag}-{sysconfig.get_platform()}".encode())
+        h.update(self.requirements_file.read_bytes())
+        return h.hexdigest()
+    
+    def _load_cached_plan(self) -> list[str] | None:
+        """
+        Load pinned requirements from a previously resolved install plan
+        
+        Returns:
+            List of ``name==version`` pins, or None if no plan matches
+        """
+        import json
+        
+        try:
+            plan = json.loads(self.plan_file.read_text())
+            if plan.get("key") != self._plan_key():
+                return None
+            return [f"{pkg['name']}=={pkg['version']}" for pkg in plan["packages"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing, unreadable or malformed plan
+            return None
+    
+    def _install_and_cache_plan(self) -> bool:
+        """
+        Install requirements.txt, caching pip's ``--report`` of what it
+        installed as the plan for the next run
+        
+        Returns:
+            True if installation successful
+        """
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            report_file = Path(tmp) / "report.json"
+            args = ['-r', str(self.requirements_file)]
+            if self._pip_supports_report():
+                args = ['--report', str(report_file), *args]
+            
+            if not self._install(args):
+                return False
+            
+            self._cache_plan(report_file)
+        return True
+    
+    def _cache_plan(self, report_file: Path) -> None:
+        """
+        Save the packages listed in a pip installation report as the
+        install plan for the current requirements
+        
+        Args:
+            report_file: Report written by ``pip install --report``
+        """
+        import json
+        
+        try:
+            report = json.loads(report_file.read_text())
+            packages = [
+                {
+                    "name": item["metadata"]["name"],
+                    "version": item["metadata"]["version"],
+                    "url": item.get("download_info", {}).get("url", ""),
+                }
+                for item in report["install"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.info("Could not read pip installation report: %s", e)
+            return
+        
+        # Nothing was installed, so keep whatever plan is already cached
+        if not packages:
+            return
+        
+        try:
+            self.plan_file.write_text(json.dumps({
+                "key": self._plan_key(),
+                "packages": packages,
+            }, indent=2))
+        except OSError as e:
+            logger.warning("Failed to cache install plan: %s", e)
+    
+    @staticmethod
+    def _pip_supports_report() -> bool:
+        """Check whether the installed pip has ``install --report`` (22.2+)"""
+        from importlib.metadata import version, PackageNotFoundError
+        
+        try:
+            major, minor = (int(part) for part in version('pip').split('.')[:2])
+        except (PackageNotFoundError, ValueError):
             return False
+        return (major, minor) >= (22, 2)
+    
+    def _requirements_satisfied(self) -> bool | None:
+        """
+        Check installed package versions against requirements.txt
+        
+        Requirements with extras also check the packages those extras pull
+        in, as declared in the installed distribution's metadata.
+        
+        Returns:
+            True if every requirement is installed at a matching version,
+            False if anything is missing or mismatched, None if the
+            requirements cannot be verified (unparseable lines, or -r/-c/-e
+            lines that pull in other requirements)
+        """
+        from importlib.metadata import version, requires, PackageNotFoundError
+        try:
+            from packaging.requirements import Requirement, InvalidRequirement
+        except ImportError:
+            try:
+                # Fall back to the copy pip vendors
+                from pip._vendor.packaging.requirements import Requirement, InvalidRequirement
+            except ImportError:
+                # Cannot parse requirements, let the caller decide
+                return None
+        
+        pending = []
+        for line in self.requirements_file.read_text().splitlines():
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith('-'):
+                # Nested requirement/constraint files and editables can't be
+                # checked here; other pip options don't affect what's installed
+                if line.split()[0].split('=')[0] in _NESTED_REQUIREMENT_OPTIONS:
+                    return None
+                continue
+            
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return None
+            
+            if req.marker is None or req.marker.evaluate({"extra": ""}):
+                pending.append(req)
+        
+        seen = set()
+        while pending:
+            req = pending.pop()
+            key = (req.name.lower(), str(req.specifier), tuple(sorted(req.extras)))
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            try:
+                installed = version(req.name)
+            except PackageNotFoundError:
+                return False
+            
+            if not req.specifier.contains(installed, prereleases=True):
+                return False
+            
+            # Queue the dependencies that only the requested extras enable
+            for dep_line in (requires(req.name) or []) if req.extras else []:
+                try:
+                    dep = Requirement(dep_line)
+                except InvalidRequirement:
+                    return None
+                if dep.marker is None or dep.marker.evaluate({"extra": ""}):
+                    continue
+                if any(dep.marker.evaluate({"extra": extra}) for extra in req.extras):
+                    pending.append(dep)
+        
+        return True
+    
+    def _requirements_digest(self) -> bytes:
+        """
+        Hash requirements.txt so unchanged requirements can be detected
+        
+        The environment prefix is mixed in so a new virtualenv never reuses
+        another environment's install record, while ``python`` and
+        ``python3`` in the same virtualenv still share one.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(sys.prefix.encode())
+        h.update(self.requirements_file.read_bytes())
+        return h.digest()
+    
+    def _recorded_digest(self) -> bytes | None:
+        """
+        Read the requirements digest stored in the setup flag file
+        
+        Returns:
+            The 16-byte digest, or None if the flag file is missing or
+            not in the current format
+        """
+        try:
+            data = self.setup_flag_file.read_bytes()
+            version, digest = _FLAG_FORMAT.unpack(data)
+        except (OSError, struct.error):
+            return None
+        
+        if version != _FLAG_VERSION:
+            return None
+        return digest
     
     def setup_env_file(self) -> bool:
         """
@@ -116,15 +616,19 @@ class BackendSetup:
             logger.warning(f".env.example not found at {self.env_example}")
             # Create a basic .env file
             self._create_default_env()
+            self._invalidate_env()
             return True
         
         try:
             # Copy .env.example to .env
-            shutil.copy(self.env_example, self.env_file)
-            logger.info(f"Created .env file from .env.example")
-            logger.warning("⚠️  Please edit .env file and add your API keys:")
-            logger.warning("   - DEEPGRAM_API_KEY")
-            logger.warning("   - GROQ_API_KEY")
+            self._write_env(self.env_example.read_bytes())
+            self._invalidate_env()
+            logger.info("Created .env file from .env.example")
+            logger.warning(
+                "⚠️  Please edit .env file and add your API keys:\n"
+                "   - DEEPGRAM_API_KEY\n"
+                "   - GROQ_API_KEY"
+            )
             return True
         except Exception as e:
             logger.error(f"Failed to create .env file: {e}")
@@ -132,62 +636,42 @@ class BackendSetup:
     
     def _create_default_env(self):
         """Create a default .env file with placeholder values"""
-        default_content = """# Deepgram API Key
-# Get your API key from: https://console.deepgram.com/
-DEEPGRAM_API_KEY=your_deepgram_api_key_here
-
-# Groq API Key
-# Get your API key from: https://console.groq.com/
-GROQ_API_KEY=your_groq_api_key_here
-
-# Optional: Server Configuration
-# HOST=0.0.0.0
-# PORT=8000
-
-# Optional: LLM Configuration
-# LLM_MODEL=llama3-70b-8192
-# LLM_TEMPERATURE=0.7
-# LLM_MAX_TOKENS=150
-"""
-        with open(self.env_file, 'w') as f:
-            f.write(default_content)
+        self._write_env(_DEFAULT_ENV_BYTES)
         logger.info("Created default .env file")
     
-    def validate_configuration(self) -> Tuple[bool, List[str]]:
+    def _write_env(self, data: bytes) -> None:
+        """Write .env with owner-only permissions, since it will hold API keys"""
+        fd = os.open(self.env_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    
+    def validate_configuration(self) -> tuple[bool, list[str]]:
         """
         Validate that required configuration is set
         
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-        
-        # Try to load environment variables
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(dotenv_path=self.env_file)
-        except ImportError:
-            # dotenv not installed yet, skip validation
-            logger.warning("python-dotenv not available, skipping configuration validation")
-            return True, []
-        
-        # Check required API keys
-        deepgram_key = os.getenv('DEEPGRAM_API_KEY', '')
-        groq_key = os.getenv('GROQ_API_KEY', '')
-        
-        if not deepgram_key or deepgram_key == 'your_deepgram_api_key_here':
-            errors.append("DEEPGRAM_API_KEY not configured in .env file")
+        # Like load_dotenv, real environment variables win over .env
+        env = self._env or {}
         
-        if not groq_key or groq_key == 'your_groq_api_key_here':
-            errors.append("GROQ_API_KEY not configured in .env file")
+        # Check required API keys are set to something other than placeholders
+        errors = [
+            f"{key} not configured in .env file"
+            for key, placeholder in _REQUIRED_KEYS.items()
+            if os.getenv(key, env.get(key, '')) in ('', placeholder)
+        ]
         
         return len(errors) == 0, errors
     
     def mark_setup_complete(self):
         """Mark setup as complete by creating flag file"""
         try:
-            with open(self.setup_flag_file, 'w') as f:
-                f.write(f"Setup completed at: {self.backend_dir}\n")
+            self.setup_flag_file.write_bytes(
+                _FLAG_FORMAT.pack(_FLAG_VERSION, self._requirements_digest())
+            )
             logger.info("Setup marked as complete")
         except Exception as e:
             logger.error(f"Failed to create setup flag file: {e}")
@@ -199,49 +683,53 @@ GROQ_API_KEY=your_groq_api_key_here
         Returns:
             True if setup completed successfully
         """
-        logger.info("=" * 60)
-        logger.info("Starting automated backend setup...")
-        logger.info("=" * 60)
+        logger.info("%s\nStarting automated backend setup...\n%s", _BANNER, _BANNER)
         
         # Step 1: Check Python version
         logger.info("\n[1/4] Checking Python version...")
         if not self.check_python_version():
             return False
         
-        # Step 2: Install dependencies
-        logger.info("\n[2/4] Installing dependencies...")
-        if not self.install_dependencies():
-            return False
+        # Steps 2 and 3 are independent, so the .env work runs alongside pip
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Step 3: Setup .env file
+        logger.info("\n[2/4] Installing dependencies...")
         logger.info("\n[3/4] Setting up environment configuration...")
-        if not self.setup_env_file():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deps_future = executor.submit(self.install_dependencies)
+            env_future = executor.submit(self.setup_env_file)
+            deps_ok = deps_future.result()
+            env_ok = env_future.result()
+        
+        if not (deps_ok and env_ok):
             return False
         
         # Step 4: Validate configuration
         logger.info("\n[4/4] Validating configuration...")
         is_valid, errors = self.validate_configuration()
         
-        if not is_valid:
-            logger.warning("\n⚠️  Configuration warnings:")
-            for error in errors:
-                logger.warning(f"   - {error}")
-            logger.warning("\nSetup completed, but please configure API keys before starting the server.")
-        else:
+        if is_valid:
             logger.info("\n✓ Configuration validated successfully")
+        elif logger.isEnabledFor(logging.WARNING):
+            # Only build the error list if it will be emitted
+            logger.warning(
+                "\n⚠️  Configuration warnings:\n%s\n"
+                "\nSetup completed, but please configure API keys before starting the server.",
+                "\n".join(f"   - {error}" for error in errors)
+            )
         
         # Mark setup as complete
         self.mark_setup_complete()
         
-        logger.info("\n" + "=" * 60)
-        logger.info("Backend setup completed!")
-        logger.info("=" * 60)
+        logger.info("\n%s\nBackend setup completed!\n%s", _BANNER, _BANNER)
         
         if not is_valid:
-            logger.info("\nNext steps:")
-            logger.info("1. Edit backend/.env file")
-            logger.info("2. Add your Deepgram and Groq API keys")
-            logger.info("3. Restart the server with: python main.py")
+            logger.info(
+                "\nNext steps:\n"
+                "1. Edit backend/.env file\n"
+                "2. Add your Deepgram and Groq API keys\n"
+                "3. Restart the server with: python main.py"
+            )
         
         return True
 
@@ -268,8 +756,17 @@ def is_setup_done() -> bool:
     return setup.is_setup_complete()
 
 
-if __name__ == "__main__":
-    # Allow running this module directly for manual setup
+def main() -> int:
+    """
+    Command-line entry point for manual setup
+    
+    Tools should import and call perform_backend_setup() / is_setup_done()
+    directly instead of spawning ``python setup.py``, which pays for a
+    fresh interpreter and package imports on every call.
+    
+    Returns:
+        Process exit code
+    """
     logging.basicConfig(
         level=logging.INFO,
         format='%(message)s'
@@ -289,9 +786,35 @@ if __name__ == "__main__":
                 print(f"  - {error}")
     else:
         print("\nBackend setup required. Starting setup process...\n")
+        
+        # When packages are missing, pip is the last heavy step: finish the
+        # other steps here, then hand the process over to pip. The next run
+        # (or server start) sees the requirements satisfied, caches pip's
+        # report as the install plan and records the setup as complete
+        # without invoking pip again.
+        if (os.name == 'posix' and setup.requirements_file.exists()
+                and not setup._requirements_satisfied()):
+            if not (setup.check_python_version() and setup.setup_env_file()):
+                print("\n✗ Setup failed. Please check the errors above.")
+                return 1
+            is_valid, errors = setup.validate_configuration()
+            if not is_valid:
+                print("\n⚠️  Configuration issues (configure API keys before starting the server):")
+                for error in errors:
+                    print(f"  - {error}")
+            print("\nInstalling dependencies. Run this script again afterwards to verify the setup.\n")
+            setup._exec_install()
+        
         success = setup.perform_setup()
         if success:
             print("\n✓ Setup completed successfully!")
         else:
             print("\n✗ Setup failed. Please check the errors above.")
-            sys.exit(1)
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    # Allow running this module directly for manual setup
+    sys.exit(main())
@@ -14,6 +14,7 @@
 let isCapturing = false;
 let shadowRoot = null;
 let overlayContainer = null;
+let streamingMessageEl = null;
 
 // Initialize when DOM is ready
 if (document.readyState === 'loading') {
@@ -391,6 +392,23 @@ function addMessage(label, text, type = 'info') {
 
   content.appendChild(messageEl);
   content.scrollTop = content.scrollHeight;
+
+  return messageEl;
+}
+
+/**
+ * Append a streamed LLM response chunk, starting a new message if needed
+ */
+function appendLlmDelta(text) {
+  if (!streamingMessageEl) {
+    streamingMessageEl = addMessage('AI Assistant', '', 'llm');
+  }
+
+  const textEl = streamingMessageEl.querySelector('.copilot-message-text');
+  textEl.textContent += text;
+
+  const content = shadowRoot.getElementById('content');
+  content.scrollTop = content.scrollHeight;
 }
 
 /**
@@ -399,6 +417,7 @@ function addMessage(label, text, type = 'info') {
 function clearContent() {
   const content = shadowRoot.getElementById('content');
   content.innerHTML = '';
+  streamingMessageEl = null;
 }
 
 /**
@@ -418,6 +437,19 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
       addMessage('AI Assistant', message.text, 'llm');
       break;
       
+    case 'llm_response_delta':
+      appendLlmDelta(message.text);
+      break;
+      
+    case 'llm_response_end':
+      streamingMessageEl = null;
+      break;
+      
+    case 'error':
+      streamingMessageEl = null;
+      addMessage('Error', message.message, 'error');
+      break;
+      
     case 'ERROR':
       addMessage('Error', message.message, 'error');
       break;
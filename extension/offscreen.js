@@ -110,8 +110,12 @@ function handleWebSocketMessage(data) {
   try {
     const message = JSON.parse(data);
     
-    // Forward transcriptions and LLM responses to content script
-    if (message.type === 'transcript' || message.type === 'llm_response') {
+    // Forward transcriptions, LLM responses and errors to content script
+    if (message.type === 'transcript' ||
+        message.type === 'llm_response' ||
+        message.type === 'llm_response_delta' ||
+        message.type === 'llm_response_end' ||
+        message.type === 'error') {
       notifyContentScript(message);
     }
     